@@ -1,51 +1,61 @@
 import os
+from dataclasses import dataclass, field
+from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
+def _env(name, default=None, cast=None):
+    """Read an environment variable lazily when Config is instantiated"""
+    def factory():
+        value = os.getenv(name, default)
+        return cast(value) if cast and value is not None else value
+    return field(default_factory=factory)
+
+@dataclass(frozen=True, slots=True)
 class Config:
     # Network Configuration
-    ARBITRUM_RPC_URL = os.getenv('ARBITRUM_RPC_URL', 'https://arb1.arbitrum.io/rpc')
-    ARBITRUM_CHAIN_ID = 42161
+    ARBITRUM_RPC_URL: str = _env('ARBITRUM_RPC_URL', 'https://arb1.arbitrum.io/rpc')
+    ARBITRUM_WS_URL: Optional[str] = _env('ARBITRUM_WS_URL')  # newHeads subscriptions, polls if unset
+    ARBITRUM_CHAIN_ID: int = 42161
     
     # Wallet Configuration
-    PRIVATE_KEY = os.getenv('PRIVATE_KEY')
-    WALLET_ADDRESS = os.getenv('WALLET_ADDRESS')
+    PRIVATE_KEY: Optional[str] = _env('PRIVATE_KEY')
+    WALLET_ADDRESS: Optional[str] = _env('WALLET_ADDRESS')
     
     # Gas Configuration
-    MAX_GAS_PRICE = int(os.getenv('MAX_GAS_PRICE', '100000000'))  # 0.1 gwei
-    GAS_LIMIT = int(os.getenv('GAS_LIMIT', '500000'))
-    PRIORITY_FEE = int(os.getenv('PRIORITY_FEE', '1000000000'))  # 1 gwei
+    MAX_GAS_PRICE: int = _env('MAX_GAS_PRICE', '100000000', int)  # 0.1 gwei
+    GAS_LIMIT: int = _env('GAS_LIMIT', '500000', int)
+    PRIORITY_FEE: int = _env('PRIORITY_FEE', '1000000000', int)  # 1 gwei
     
     # Presale Configuration
-    PRESALE_CONTRACT_ADDRESS = os.getenv('PRESALE_CONTRACT_ADDRESS')
-    TOKEN_AMOUNT = float(os.getenv('TOKEN_AMOUNT', '0.1'))  # ETH amount to invest
-    MIN_LIQUIDITY = float(os.getenv('MIN_LIQUIDITY', '0.5'))  # Minimum liquidity ratio
+    PRESALE_CONTRACT_ADDRESS: Optional[str] = _env('PRESALE_CONTRACT_ADDRESS')
+    TOKEN_AMOUNT: float = _env('TOKEN_AMOUNT', '0.1', float)  # ETH amount to invest
+    MIN_LIQUIDITY: float = _env('MIN_LIQUIDITY', '0.5', float)  # Minimum liquidity ratio
     
     # Bot Configuration
-    MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
-    RETRY_DELAY = int(os.getenv('RETRY_DELAY', '2'))  # seconds
-    MONITOR_INTERVAL = int(os.getenv('MONITOR_INTERVAL', '5'))  # seconds
+    MAX_RETRIES: int = _env('MAX_RETRIES', '3', int)
+    RETRY_DELAY: int = _env('RETRY_DELAY', '2', int)  # seconds
+    MONITOR_INTERVAL: int = _env('MONITOR_INTERVAL', '5', int)  # seconds
     
     # Safety Configuration
-    MAX_SLIPPAGE = float(os.getenv('MAX_SLIPPAGE', '0.05'))  # 5%
-    MIN_BLOCK_CONFIRMATIONS = int(os.getenv('MIN_BLOCK_CONFIRMATIONS', '1'))
+    MAX_SLIPPAGE: float = _env('MAX_SLIPPAGE', '0.05', float)  # 5%
+    MIN_BLOCK_CONFIRMATIONS: int = _env('MIN_BLOCK_CONFIRMATIONS', '1', int)
     
     # Logging Configuration
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-    LOG_FILE = os.getenv('LOG_FILE', 'arbitrum_bot.log')
+    LOG_LEVEL: str = _env('LOG_LEVEL', 'INFO')
+    LOG_FILE: str = _env('LOG_FILE', 'arbitrum_bot.log')
     
     # Telegram Notifications (Optional)
-    TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
-    TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
+    TELEGRAM_BOT_TOKEN: Optional[str] = _env('TELEGRAM_BOT_TOKEN')
+    TELEGRAM_CHAT_ID: Optional[str] = _env('TELEGRAM_CHAT_ID')
     
-    @classmethod
-    def validate(cls):
+    def validate(self):
         """Validate required configuration"""
         required_fields = ['PRIVATE_KEY', 'WALLET_ADDRESS', 'PRESALE_CONTRACT_ADDRESS']
-        missing_fields = [field for field in required_fields if not getattr(cls, field)]
+        missing_fields = [name for name in required_fields if not getattr(self, name)]
         
         if missing_fields:
             raise ValueError(f"Missing required configuration: {', '.join(missing_fields)}")
         
-        return True 
\ No newline at end of file
+        return True
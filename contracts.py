@@ -1,6 +1,17 @@
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from web3 import Web3
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
 from eth_abi import encode
 
+from units import ETHER
+
+# Selector of the no-argument buy() overload
+_BUY_CALLDATA = Web3.to_hex(Web3.keccak(text='buy()')[:4])
+
+# Shared pool for fanning out independent view calls over the HTTP provider
+_CALL_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
 class PresaleContracts:
     """Common presale contract ABIs and functions"""
     
@@ -124,6 +135,16 @@ class PresaleContracts:
         }
     ]
     
+    # PRESALE_ABI subset for the view calls made every monitor tick, so web3
+    # has fewer entries to search and no buy() overloads to resolve
+    HOT_PRESALE_ABI = [
+        entry for entry in PRESALE_ABI
+        if entry['name'] in {
+            'token', 'presaleStartTime', 'presaleEndTime', 'softCap', 'hardCap',
+            'totalRaised', 'isPresaleActive', 'getTokenPrice', 'getTokensForEth'
+        }
+    ]
+    
     # Uniswap V2 Router ABI (for post-presale swaps)
     UNISWAP_V2_ROUTER_ABI = [
         {
@@ -144,61 +165,109 @@ class PresaleContracts:
     @staticmethod
     def get_presale_info(web3, contract_address):
         """Get presale contract information"""
-        contract = web3.eth.contract(
-            address=Web3.to_checksum_address(contract_address),
-            abi=PresaleContracts.PRESALE_ABI
-        )
+        contract = _presale_contract(web3, contract_address)
         
         try:
-            info = {
-                'token_address': contract.functions.token().call(),
-                'presale_start': contract.functions.presaleStartTime().call(),
-                'presale_end': contract.functions.presaleEndTime().call(),
-                'soft_cap': contract.functions.softCap().call(),
-                'hard_cap': contract.functions.hardCap().call(),
-                'total_raised': contract.functions.totalRaised().call(),
-                'is_active': contract.functions.isPresaleActive().call(),
-                'token_price': contract.functions.getTokenPrice().call()
-            }
+            results = _call_concurrent([
+                contract.functions.token(),
+                contract.functions.presaleStartTime(),
+                contract.functions.presaleEndTime(),
+                contract.functions.softCap(),
+                contract.functions.hardCap(),
+                contract.functions.totalRaised(),
+                contract.functions.isPresaleActive(),
+                contract.functions.getTokenPrice()
+            ])
+            info = dict(zip(
+                ('token_address', 'presale_start', 'presale_end', 'soft_cap',
+                 'hard_cap', 'total_raised', 'is_active', 'token_price'),
+                results
+            ))
             return info
         except Exception as e:
             raise Exception(f"Failed to get presale info: {str(e)}")
     
     @staticmethod
-    def calculate_tokens_for_eth(web3, contract_address, eth_amount):
-        """Calculate tokens received for ETH amount"""
-        contract = web3.eth.contract(
-            address=Web3.to_checksum_address(contract_address),
-            abi=PresaleContracts.PRESALE_ABI
-        )
+    def get_presale_dynamic(web3, contract_address):
+        """Get the presale fields that change while the presale runs"""
+        contract = _presale_contract(web3, contract_address)
         
         try:
-            # Try to get tokens for 1 ETH first
-            tokens_per_eth = contract.functions.getTokensForEth().call()
-            return tokens_per_eth * eth_amount
+            total_raised, is_active = _call_concurrent([
+                contract.functions.totalRaised(),
+                contract.functions.isPresaleActive()
+            ])
+            return {
+                'total_raised': total_raised,
+                'is_active': is_active
+            }
+        except Exception as e:
+            raise Exception(f"Failed to get presale info: {str(e)}")
+    
+    @staticmethod
+    def calculate_tokens_for_eth(web3, contract_address, wei_amount):
+        """Calculate tokens received for an ETH amount in wei"""
+        try:
+            return _tokens_calculator(web3, contract_address)(wei_amount)
         except Exception as e:
-            # Fallback to price calculation
-            try:
-                token_price = contract.functions.getTokenPrice().call()
-                return (eth_amount * 10**18) // token_price
-            except Exception as e2:
-                raise Exception(f"Failed to calculate tokens: {str(e2)}")
+            raise Exception(f"Failed to calculate tokens: {str(e)}")
     
     @staticmethod
-    def build_buy_transaction(web3, contract_address, eth_amount, gas_price, gas_limit):
+    def build_buy_transaction(web3, contract_address, wei_amount, gas_price, gas_limit, chain_id, nonce=None):
         """Build presale buy transaction"""
-        contract = web3.eth.contract(
-            address=Web3.to_checksum_address(contract_address),
-            abi=PresaleContracts.PRESALE_ABI
-        )
+        if nonce is None:
+            nonce = web3.eth.get_transaction_count(web3.eth.default_account)
         
-        # Build transaction
-        transaction = contract.functions.buy().build_transaction({
+        # buy() takes no arguments, so its calldata is just the selector
+        transaction = {
+            'to': Web3.to_checksum_address(contract_address),
             'from': web3.eth.default_account,
-            'value': web3.to_wei(eth_amount, 'ether'),
+            'value': wei_amount,
             'gas': gas_limit,
             'gasPrice': gas_price,
-            'nonce': web3.eth.get_transaction_count(web3.eth.default_account)
-        })
+            'nonce': nonce,
+            'data': _BUY_CALLDATA,
+            'chainId': chain_id
+        }
         
-        return transaction 
\ No newline at end of file
+        return transaction
+
+
+@functools.lru_cache(maxsize=8)
+def _contract_factory(web3, abi_name):
+    """Get the Contract class for one of the PresaleContracts ABIs, validated once"""
+    return web3.eth.contract(abi=getattr(PresaleContracts, abi_name))
+
+
+@functools.lru_cache(maxsize=8)
+def _contract(web3, abi_name, contract_address):
+    """Get a contract instance bound to web3, built once per ABI and address"""
+    factory = _contract_factory(web3, abi_name)
+    return factory(address=Web3.to_checksum_address(contract_address))
+
+
+def _presale_contract(web3, contract_address):
+    """Get a presale contract bound to web3 with only the hot view functions"""
+    return _contract(web3, 'HOT_PRESALE_ABI', contract_address)
+
+
+@functools.lru_cache(maxsize=8)
+def _tokens_calculator(web3, contract_address):
+    """Probe once which quote function the presale implements"""
+    contract = _presale_contract(web3, contract_address)
+    get_tokens_for_eth = contract.functions.getTokensForEth
+    
+    try:
+        # Try to get tokens for 1 ETH first
+        get_tokens_for_eth().call()
+    except (ContractLogicError, BadFunctionCallOutput):
+        # Fallback to price calculation
+        get_token_price = contract.functions.getTokenPrice
+        return lambda wei_amount: wei_amount // get_token_price().call()
+    
+    return lambda wei_amount: get_tokens_for_eth().call() * wei_amount // ETHER
+
+
+def _call_concurrent(calls):
+    """Run independent contract view calls concurrently, results in call order"""
+    return list(_CALL_EXECUTOR.map(lambda call: call.call(), calls))
@@ -70,6 +70,7 @@ if [ ! -f .env ]; then
     cat > .env << 'EOF'
 # Arbitrum Network
 ARBITRUM_RPC_URL=https://arb1.arbitrum.io/rpc
+ARBITRUM_WS_URL=
 
 # Wallet
 PRIVATE_KEY=your_private_key_here
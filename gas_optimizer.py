@@ -1,8 +1,17 @@
-import time
 import asyncio
-from web3 import Web3
-from eth_account import Account
-import requests
+from contextlib import aclosing
+from web3 import AsyncWeb3, WebsocketProviderV2
+
+from units import GWEI
+
+
+async def new_heads(ws_url):
+    """Yield block headers from an eth_subscribe('newHeads') WebSocket subscription"""
+    provider = WebsocketProviderV2(ws_url)
+    async with AsyncWeb3.persistent_websocket(provider) as ws_web3:
+        await ws_web3.eth.subscribe('newHeads')
+        async for response in ws_web3.ws.listen_to_websocket():
+            yield response['result']
 
 class ArbitrumGasOptimizer:
     """Gas optimization for Arbitrum network"""
@@ -10,7 +19,6 @@ class ArbitrumGasOptimizer:
     def __init__(self, web3, config):
         self.web3 = web3
         self.config = config
-        self.account = Account.from_key(config.PRIVATE_KEY)
         
     def get_current_gas_price(self):
         """Get current gas price from network"""
@@ -70,42 +78,62 @@ class ArbitrumGasOptimizer:
                 'maxPriorityFeePerGas': self.config.PRIORITY_FEE
             }
     
-    def wait_for_optimal_gas(self, max_wait_time=300):
+    async def wait_for_optimal_gas(self, max_wait_time=300):
         """Wait for optimal gas conditions"""
-        start_time = time.time()
-        
-        while time.time() - start_time < max_wait_time:
-            current_gas = self.get_current_gas_price()
-            
-            # If gas is below our threshold, proceed
-            if current_gas <= self.config.MAX_GAS_PRICE:
-                print(f"Gas price optimal: {self.web3.from_wei(current_gas, 'gwei')} gwei")
-                return True
-            
-            print(f"Gas price too high: {self.web3.from_wei(current_gas, 'gwei')} gwei, waiting...")
-            time.sleep(10)
+        try:
+            return await asyncio.wait_for(self._wait_for_gas_below_max(), max_wait_time)
+        except asyncio.TimeoutError:
+            print("Timeout waiting for optimal gas price")
+            return False
+    
+    async def _wait_for_gas_below_max(self):
+        """Return once the base fee drops to MAX_GAS_PRICE"""
+        max_gas_gwei = self.config.MAX_GAS_PRICE / GWEI
         
-        print("Timeout waiting for optimal gas price")
-        return False
+        async with aclosing(self._gas_stats_updates()) as updates:
+            async for gas_stats in updates:
+                # If gas is below our threshold, proceed
+                if gas_stats['base_fee_gwei'] <= max_gas_gwei:
+                    print(f"Gas price optimal: {gas_stats['base_fee_gwei']} gwei")
+                    return True
+                
+                print(f"Gas price too high: {gas_stats['base_fee_gwei']} gwei, waiting...")
+    
+    async def _gas_stats_updates(self):
+        """Yield gas stats for every new block, polling if no WebSocket is configured"""
+        if self.config.ARBITRUM_WS_URL:
+            async with aclosing(new_heads(self.config.ARBITRUM_WS_URL)) as heads:
+                async for header in heads:
+                    yield self._gas_stats_from_block(header)
+        else:
+            while True:
+                gas_stats = self.get_gas_stats()
+                if gas_stats:
+                    yield gas_stats
+                await asyncio.sleep(self.config.MONITOR_INTERVAL)
     
     def get_gas_stats(self):
         """Get current gas statistics"""
         try:
             latest_block = self.web3.eth.get_block('latest')
-            base_fee = latest_block['baseFeePerGas']
-            gas_used = latest_block['gasUsed']
-            gas_limit = latest_block['gasLimit']
-            
-            return {
-                'base_fee_gwei': self.web3.from_wei(base_fee, 'gwei'),
-                'gas_used': gas_used,
-                'gas_limit': gas_limit,
-                'utilization': gas_used / gas_limit * 100
-            }
+            return self._gas_stats_from_block(latest_block)
         except Exception as e:
             print(f"Error getting gas stats: {e}")
             return None
     
+    def _gas_stats_from_block(self, block):
+        """Build gas statistics from a block or block header"""
+        base_fee = block['baseFeePerGas']
+        gas_used = block['gasUsed']
+        gas_limit = block['gasLimit']
+        
+        return {
+            'base_fee_gwei': base_fee / GWEI,
+            'gas_used': gas_used,
+            'gas_limit': gas_limit,
+            'utilization': gas_used / gas_limit * 100
+        }
+    
     def calculate_transaction_cost(self, gas_limit, gas_price):
         """Calculate transaction cost in ETH"""
         total_cost = gas_limit * gas_price
@@ -117,22 +145,22 @@ class ArbitrumGasOptimizer:
     
     async def monitor_gas_conditions(self, callback=None):
         """Monitor gas conditions and execute callback when optimal"""
+        max_gas_gwei = self.config.MAX_GAS_PRICE / GWEI
+        
         while True:
             try:
-                gas_stats = self.get_gas_stats()
-                if gas_stats:
-                    print(f"Gas Stats: Base Fee: {gas_stats['base_fee_gwei']:.2f} gwei, "
-                          f"Utilization: {gas_stats['utilization']:.1f}%")
-                    
-                    # Check if conditions are optimal
-                    if (gas_stats['base_fee_gwei'] <= self.config.MAX_GAS_PRICE / 1e9 and 
-                        gas_stats['utilization'] < 80):
-                        if callback:
-                            await callback()
-                        break
-                
-                await asyncio.sleep(self.config.MONITOR_INTERVAL)
+                async with aclosing(self._gas_stats_updates()) as updates:
+                    async for gas_stats in updates:
+                        print(f"Gas Stats: Base Fee: {gas_stats['base_fee_gwei']:.2f} gwei, "
+                              f"Utilization: {gas_stats['utilization']:.1f}%")
+                        
+                        # Check if conditions are optimal
+                        if (gas_stats['base_fee_gwei'] <= max_gas_gwei and 
+                            gas_stats['utilization'] < 80):
+                            if callback:
+                                await callback()
+                            return
                 
             except Exception as e:
                 print(f"Error monitoring gas: {e}")
-                await asyncio.sleep(10) 
\ No newline at end of file
+                await asyncio.sleep(10)
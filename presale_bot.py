@@ -1,16 +1,23 @@
 import asyncio
 import time
 import logging
+from contextlib import aclosing
 from datetime import datetime
 from web3 import Web3
+from web3.exceptions import TransactionNotFound
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
-import json
+from collections import deque
 
 from config import Config
 from contracts import PresaleContracts
-from gas_optimizer import ArbitrumGasOptimizer
+from gas_optimizer import ArbitrumGasOptimizer, new_heads
+from providers import OrjsonHTTPProvider
 from telegram_notifier import TelegramNotifier
+from units import ETHER
+
+TRANSACTION_HISTORY_SIZE = 256
+STATIC_PRESALE_FIELDS = ('token_address', 'presale_start', 'presale_end', 'soft_cap', 'hard_cap')
 
 class ArbitrumPresaleBot:
     """Main presale bot for Arbitrum network"""
@@ -20,7 +27,7 @@ class ArbitrumPresaleBot:
         self.config.validate()
         
         # Setup Web3
-        self.web3 = Web3(Web3.HTTPProvider(self.config.ARBITRUM_RPC_URL))
+        self.web3 = Web3(OrjsonHTTPProvider(self.config.ARBITRUM_RPC_URL))
         self.web3.eth.default_account = self.config.WALLET_ADDRESS
         
         # Setup account
@@ -38,7 +45,23 @@ class ArbitrumPresaleBot:
         # Bot state
         self.is_running = False
         self.last_transaction = None
-        self.transaction_history = []
+        self.transaction_history = deque(maxlen=TRANSACTION_HISTORY_SIZE)
+        
+        # Loop that notify() hands notifications from worker threads to
+        self._loop = None
+        
+        # (buy amount in wei, transaction fields) reused by sign_buy_transaction
+        self._buy_tx_template = None
+        
+        # Nonce of the next or in-flight buy, synced from the node lazily and
+        # advanced once a receipt confirms it
+        self._nonce = None
+        
+        # (tx hash, amount in wei) of buys sent at that nonce but not yet mined
+        self._inflight_buys = []
+        
+        # Presale fields that don't change during a run, fetched once in run()
+        self._static_presale_info = None
         
     def setup_logging(self):
         """Setup logging configuration"""
@@ -52,13 +75,29 @@ class ArbitrumPresaleBot:
         )
         self.logger = logging.getLogger(__name__)
     
+    def notify(self, kind, *args):
+        """Send a Telegram notification from any thread, e.g. notify('error', msg, context)"""
+        send = getattr(self.telegram, f"send_{kind}_notification")
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Worker threads, like the startup checks, hand off to the bot's loop
+            if self._loop is None or self._loop.is_closed():
+                self.logger.warning(f"No event loop, dropping {kind} notification")
+                return
+            self._loop.call_soon_threadsafe(send, *args)
+            return
+        send(*args)
+    
     def check_network_connection(self):
         """Check if connected to Arbitrum network"""
         try:
-            if not self.web3.is_connected():
-                raise Exception("Not connected to Arbitrum network")
+            # A single eth_chainId proves both connectivity and the network
+            try:
+                chain_id = self.web3.eth.chain_id
+            except Exception as e:
+                raise Exception(f"Not connected to Arbitrum network: {e}")
             
-            chain_id = self.web3.eth.chain_id
             if chain_id != self.config.ARBITRUM_CHAIN_ID:
                 raise Exception(f"Wrong network. Expected Arbitrum (42161), got {chain_id}")
             
@@ -67,14 +106,14 @@ class ArbitrumPresaleBot:
             
         except Exception as e:
             self.logger.error(f"Network connection error: {e}")
-            asyncio.create_task(self.telegram.send_error_notification(str(e), "Network connection check"))
+            self.notify('error', str(e), "Network connection check")
             return False
     
     def check_wallet_balance(self):
         """Check wallet ETH balance"""
         try:
             balance = self.web3.eth.get_balance(self.config.WALLET_ADDRESS)
-            balance_eth = self.web3.from_wei(balance, 'ether')
+            balance_eth = balance / ETHER
             
             self.logger.info(f"Wallet balance: {balance_eth:.4f} ETH")
             
@@ -82,170 +121,260 @@ class ArbitrumPresaleBot:
             required_amount = self.config.TOKEN_AMOUNT + 0.01  # Add buffer for gas
             if balance_eth < required_amount:
                 self.logger.error(f"Insufficient balance. Need {required_amount} ETH, have {balance_eth} ETH")
-                asyncio.create_task(self.telegram.send_balance_warning_notification(balance_eth, required_amount))
+                self.notify('balance_warning', balance_eth, required_amount)
                 return False
             
             return True
             
         except Exception as e:
             self.logger.error(f"Error checking balance: {e}")
-            asyncio.create_task(self.telegram.send_error_notification(str(e), "Balance check"))
+            self.notify('error', str(e), "Balance check")
             return False
     
     def validate_presale_contract(self):
         """Validate presale contract and get information"""
         try:
-            presale_info = PresaleContracts.get_presale_info(
-                self.web3, 
-                self.config.PRESALE_CONTRACT_ADDRESS
-            )
+            if self._static_presale_info:
+                presale_info = {
+                    **self._static_presale_info,
+                    **PresaleContracts.get_presale_dynamic(
+                        self.web3,
+                        self.config.PRESALE_CONTRACT_ADDRESS
+                    )
+                }
+            else:
+                presale_info = PresaleContracts.get_presale_info(
+                    self.web3, 
+                    self.config.PRESALE_CONTRACT_ADDRESS
+                )
             
-            self.logger.info("Presale Contract Information:")
-            self.logger.info(f"Token Address: {presale_info['token_address']}")
-            self.logger.info(f"Start Time: {datetime.fromtimestamp(presale_info['presale_start'])}")
-            self.logger.info(f"End Time: {datetime.fromtimestamp(presale_info['presale_end'])}")
-            self.logger.info(f"Soft Cap: {self.web3.from_wei(presale_info['soft_cap'], 'ether')} ETH")
-            self.logger.info(f"Hard Cap: {self.web3.from_wei(presale_info['hard_cap'], 'ether')} ETH")
-            self.logger.info(f"Total Raised: {self.web3.from_wei(presale_info['total_raised'], 'ether')} ETH")
-            self.logger.info(f"Is Active: {presale_info['is_active']}")
+            # Skip the wei conversions and formatting when INFO is filtered out
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Presale Contract Information:")
+                self.logger.info(f"Token Address: {presale_info['token_address']}")
+                self.logger.info(f"Start Time: {datetime.fromtimestamp(presale_info['presale_start'])}")
+                self.logger.info(f"End Time: {datetime.fromtimestamp(presale_info['presale_end'])}")
+                self.logger.info(f"Soft Cap: {presale_info['soft_cap'] / ETHER} ETH")
+                self.logger.info(f"Hard Cap: {presale_info['hard_cap'] / ETHER} ETH")
+                self.logger.info(f"Total Raised: {presale_info['total_raised'] / ETHER} ETH")
+                self.logger.info(f"Is Active: {presale_info['is_active']}")
             
             # Check if presale is active
             if not presale_info['is_active']:
                 self.logger.error("Presale is not active")
-                asyncio.create_task(self.telegram.send_error_notification("Presale is not active", "Contract validation"))
+                self.notify('error', "Presale is not active", "Contract validation")
                 return False
             
             # Check if presale hasn't ended
             current_time = int(time.time())
             if current_time > presale_info['presale_end']:
                 self.logger.error("Presale has ended")
-                asyncio.create_task(self.telegram.send_presale_ended_notification(
-                    self.web3.from_wei(presale_info['total_raised'], 'ether'),
-                    self.web3.from_wei(presale_info['hard_cap'], 'ether')
-                ))
+                self.notify(
+                    'presale_ended',
+                    presale_info['total_raised'] / ETHER,
+                    presale_info['hard_cap'] / ETHER
+                )
                 return False
             
             # Check if hard cap reached
             if presale_info['total_raised'] >= presale_info['hard_cap']:
                 self.logger.error("Hard cap reached")
-                asyncio.create_task(self.telegram.send_error_notification("Hard cap reached", "Contract validation"))
+                self.notify('error', "Hard cap reached", "Contract validation")
                 return False
             
             return presale_info
             
         except Exception as e:
             self.logger.error(f"Error validating presale contract: {e}")
-            asyncio.create_task(self.telegram.send_error_notification(str(e), "Contract validation"))
+            self.notify('error', str(e), "Contract validation")
             return False
     
+    def get_next_nonce(self):
+        """Get the nonce for the next transaction, syncing from the node if needed"""
+        if self._nonce is None:
+            self._nonce = self.web3.eth.get_transaction_count(self.config.WALLET_ADDRESS, 'pending')
+        return self._nonce
+    
+    def sign_buy_transaction(self, buy_amount_wei):
+        """Sign a buy transaction, reusing the fixed fields across retries"""
+        if self._buy_tx_template and self._buy_tx_template[0] == buy_amount_wei:
+            template = self._buy_tx_template[1]
+            fee_params = self.gas_optimizer.get_arbitrum_gas_estimate()
+        else:
+            transaction = PresaleContracts.build_buy_transaction(
+                self.web3,
+                self.config.PRESALE_CONTRACT_ADDRESS,
+                buy_amount_wei,
+                self.config.MAX_GAS_PRICE,
+                self.config.GAS_LIMIT,
+                self.config.ARBITRUM_CHAIN_ID,
+                nonce=self.get_next_nonce()
+            )
+            # EIP-1559 fee fields replace the legacy gasPrice
+            del transaction['gasPrice']
+            
+            # Optimize gas parameters
+            fee_params = self.gas_optimizer.optimize_gas_for_transaction(transaction)
+            template = {**transaction, 'gas': fee_params['gas']}
+            self._buy_tx_template = (buy_amount_wei, template)
+        
+        # Only the nonce and fees change between attempts
+        transaction = {
+            **template,
+            'nonce': self.get_next_nonce(),
+            'maxFeePerGas': fee_params['maxFeePerGas'],
+            'maxPriorityFeePerGas': fee_params['maxPriorityFeePerGas']
+        }
+        return self.account.sign_transaction(transaction)
+    
     def calculate_optimal_buy_amount(self, presale_info):
-        """Calculate optimal buy amount based on presale conditions"""
+        """Calculate optimal buy amount in wei based on presale conditions"""
         try:
+            # Caps and raised amount come from the contract in wei
             hard_cap = presale_info['hard_cap']
             total_raised = presale_info['total_raised']
-            remaining = hard_cap - total_raised
+            remaining_wei = hard_cap - total_raised
             
             # Calculate what we can buy
-            max_buy = min(self.config.TOKEN_AMOUNT, self.web3.to_wei(remaining, 'ether'))
+            target_wei = self.web3.to_wei(self.config.TOKEN_AMOUNT, 'ether')
+            max_buy_wei = min(target_wei, remaining_wei)
             
-            if max_buy <= 0:
+            if max_buy_wei <= 0:
                 self.logger.error("No remaining allocation in presale")
                 return 0
             
-            return self.web3.from_wei(max_buy, 'ether')
+            return max_buy_wei
             
         except Exception as e:
             self.logger.error(f"Error calculating buy amount: {e}")
             return 0
     
-    async def execute_buy_transaction(self, buy_amount):
-        """Execute the buy transaction"""
+    async def execute_buy_transaction(self, buy_amount_wei):
+        """Execute the buy transaction for an amount in wei"""
         try:
+            # An earlier attempt may have been mined after its receipt wait gave up
+            for tx_hash, amount_wei in self._inflight_buys:
+                receipt = await self.find_receipt(tx_hash)
+                if receipt is not None:
+                    return self.handle_buy_receipt(tx_hash, receipt, amount_wei)
+            
+            buy_amount = buy_amount_wei / ETHER
             self.logger.info(f"Executing buy transaction for {buy_amount} ETH")
             
             # Get current gas price for notification
             current_gas = self.gas_optimizer.get_current_gas_price()
-            await self.telegram.send_buy_attempt_notification(buy_amount, current_gas)
+            self.notify('buy_attempt', buy_amount, current_gas)
             
-            # Build transaction
-            transaction = PresaleContracts.build_buy_transaction(
-                self.web3,
-                self.config.PRESALE_CONTRACT_ADDRESS,
-                buy_amount,
-                self.config.MAX_GAS_PRICE,
-                self.config.GAS_LIMIT
-            )
-            
-            # Optimize gas parameters
-            gas_params = self.gas_optimizer.optimize_gas_for_transaction(transaction)
-            transaction.update(gas_params)
-            
-            # Sign transaction
-            signed_txn = self.web3.eth.account.sign_transaction(transaction, self.config.PRIVATE_KEY)
+            # Build and sign transaction
+            signed_txn = self.sign_buy_transaction(buy_amount_wei)
             
             # Send transaction
             tx_hash = self.web3.eth.send_raw_transaction(signed_txn.rawTransaction)
+            self._inflight_buys.append((tx_hash, buy_amount_wei))
             self.logger.info(f"Transaction sent: {tx_hash.hex()}")
             
             # Wait for confirmation
-            receipt = self.web3.eth.wait_for_transaction_receipt(
-                tx_hash, 
-                timeout=300,
-                poll_latency=2
-            )
-            
-            if receipt.status == 1:
-                self.logger.info(f"Transaction successful! Block: {receipt.blockNumber}")
-                
-                # Calculate tokens received
-                tokens_received = PresaleContracts.calculate_tokens_for_eth(
-                    self.web3,
-                    self.config.PRESALE_CONTRACT_ADDRESS,
-                    buy_amount
-                )
-                
-                self.logger.info(f"Tokens received: {tokens_received}")
-                
-                # Send success notification
-                await self.telegram.send_buy_success_notification(
-                    tx_hash.hex(),
-                    buy_amount,
-                    tokens_received,
-                    receipt.gasUsed
-                )
-                
-                # Store transaction info
-                self.last_transaction = {
-                    'tx_hash': tx_hash.hex(),
-                    'block_number': receipt.blockNumber,
-                    'gas_used': receipt.gasUsed,
-                    'eth_amount': buy_amount,
-                    'tokens_received': tokens_received,
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                self.transaction_history.append(self.last_transaction)
-                
-                return True
-            else:
-                self.logger.error("Transaction failed")
-                await self.telegram.send_buy_failure_notification("Transaction reverted")
-                return False
+            receipt = await self.wait_for_receipt(tx_hash, timeout=300)
+            return self.handle_buy_receipt(tx_hash, receipt, buy_amount_wei)
                 
         except Exception as e:
             self.logger.error(f"Error executing buy transaction: {e}")
-            await self.telegram.send_buy_failure_notification(str(e))
+            if 'nonce too low' in str(e).lower():
+                # Something else used the nonce, re-sync on the next attempt
+                self._nonce = None
+                self._inflight_buys.clear()
+            self.notify('buy_failure', str(e))
             return False
     
+    def handle_buy_receipt(self, tx_hash, receipt, buy_amount_wei):
+        """Record a mined buy, returning whether it succeeded"""
+        # Only a mined transaction uses up its nonce. Until then retries reuse it,
+        # so they replace the pending buy rather than queue a second one
+        self._nonce += 1
+        self._inflight_buys.clear()
+        
+        if receipt.status != 1:
+            self.logger.error("Transaction failed")
+            self.notify('buy_failure', "Transaction reverted")
+            return False
+        
+        buy_amount = buy_amount_wei / ETHER
+        self.logger.info(f"Transaction successful! Block: {receipt.blockNumber}")
+        
+        # Calculate tokens received
+        tokens_received = PresaleContracts.calculate_tokens_for_eth(
+            self.web3,
+            self.config.PRESALE_CONTRACT_ADDRESS,
+            buy_amount_wei
+        )
+        
+        self.logger.info(f"Tokens received: {tokens_received}")
+        
+        # Send success notification
+        self.notify('buy_success', tx_hash.hex(), buy_amount, tokens_received, receipt.gasUsed)
+        
+        # Store transaction info
+        self.last_transaction = {
+            'tx_hash': tx_hash.hex(),
+            'block_number': receipt.blockNumber,
+            'gas_used': receipt.gasUsed,
+            'eth_amount': buy_amount,
+            'tokens_received': tokens_received,
+            'timestamp': datetime.now().isoformat()
+        }
+        
+        self.transaction_history.append(self.last_transaction)
+        
+        return True
+    
+    async def find_receipt(self, tx_hash):
+        """Get a transaction receipt, or None if it isn't mined yet"""
+        try:
+            return await asyncio.to_thread(self.web3.eth.get_transaction_receipt, tx_hash)
+        except TransactionNotFound:
+            return None
+    
+    async def wait_for_receipt(self, tx_hash, timeout=300):
+        """Wait for a transaction receipt, checking once per new block when subscribed"""
+        if not self.config.ARBITRUM_WS_URL:
+            # The sync provider polls with time.sleep, keep it off the event loop
+            return await asyncio.to_thread(
+                self.web3.eth.wait_for_transaction_receipt,
+                tx_hash, 
+                timeout=timeout,
+                poll_latency=2
+            )
+        
+        return await asyncio.wait_for(self._receipt_on_new_heads(tx_hash), timeout)
+    
+    async def _receipt_on_new_heads(self, tx_hash):
+        """Look up the receipt each time a new block arrives"""
+        async with aclosing(new_heads(self.config.ARBITRUM_WS_URL)) as heads:
+            async for _ in heads:
+                receipt = await self.find_receipt(tx_hash)
+                if receipt is not None:
+                    return receipt
+    
     async def monitor_presale_conditions(self):
         """Monitor presale conditions and execute when optimal"""
+        monitor_interval = self.config.MONITOR_INTERVAL
+        max_gas_price = self.config.MAX_GAS_PRICE
+        
+        # Sleep through the wait until the final minute before start instead of
+        # polling the contract every tick
+        if self._static_presale_info:
+            time_until_prepare = self._static_presale_info['presale_start'] - 60 - int(time.time())
+            if time_until_prepare > 0:
+                self.logger.info(f"Presale starts in {time_until_prepare + 60} seconds, sleeping until 1 minute before")
+                await asyncio.sleep(time_until_prepare)
+        
         while self.is_running:
             try:
                 # Check presale status
                 presale_info = self.validate_presale_contract()
                 if not presale_info:
                     self.logger.warning("Presale validation failed, retrying...")
-                    await asyncio.sleep(self.config.MONITOR_INTERVAL)
+                    await asyncio.sleep(monitor_interval)
                     continue
                 
                 # Check if presale is about to start
@@ -258,7 +387,7 @@ class ArbitrumPresaleBot:
                         self.logger.info("Preparing for presale start...")
                         await self.prepare_for_presale()
                         # Send presale start notification
-                        await self.telegram.send_presale_start_notification(presale_info)
+                        self.notify('presale_start', presale_info)
                     await asyncio.sleep(min(time_until_start, 10))
                     continue
                 
@@ -277,17 +406,17 @@ class ArbitrumPresaleBot:
                                 break
                         else:
                             self.logger.info("Waiting for better gas conditions...")
-                            await self.telegram.send_gas_warning_notification(current_gas, self.config.MAX_GAS_PRICE)
+                            self.notify('gas_warning', current_gas, max_gas_price)
                             await asyncio.sleep(5)
                     else:
                         self.logger.warning("No allocation available")
                         await asyncio.sleep(10)
                 
-                await asyncio.sleep(self.config.MONITOR_INTERVAL)
+                await asyncio.sleep(monitor_interval)
                 
             except Exception as e:
                 self.logger.error(f"Error in monitoring loop: {e}")
-                await self.telegram.send_error_notification(str(e), "Monitoring loop")
+                self.notify('error', str(e), "Monitoring loop")
                 await asyncio.sleep(10)
     
     async def prepare_for_presale(self):
@@ -311,7 +440,7 @@ class ArbitrumPresaleBot:
             
         except Exception as e:
             self.logger.error(f"Error preparing for presale: {e}")
-            await self.telegram.send_error_notification(str(e), "Presale preparation")
+            self.notify('error', str(e), "Presale preparation")
             return False
     
     async def run(self):
@@ -319,25 +448,39 @@ class ArbitrumPresaleBot:
         try:
             self.logger.info("Starting Arbitrum Presale Bot...")
             
-            # Send startup notification
-            await self.telegram.send_startup_notification()
+            self._loop = asyncio.get_running_loop()
             
-            # Initial checks
-            if not self.check_network_connection():
-                return False
+            # Open the Telegram connection before the first notification needs it
+            await self.telegram.warm_up()
             
-            if not self.check_wallet_balance():
-                return False
+            # Send startup notification
+            self.notify('startup')
+            
+            # Initial checks are independent, run their RPCs concurrently
+            results = await asyncio.gather(
+                asyncio.to_thread(self.check_network_connection),
+                asyncio.to_thread(self.check_wallet_balance),
+                asyncio.to_thread(self.validate_presale_contract),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    self.logger.error(f"Startup check failed: {result}")
+                    return False
+                if not result:
+                    return False
             
-            # Validate presale contract
-            presale_info = self.validate_presale_contract()
-            if not presale_info:
-                return False
+            presale_info = results[2]
+            
+            # Only fields fixed at deployment are safe to reuse across ticks
+            self._static_presale_info = {
+                key: presale_info[key] for key in STATIC_PRESALE_FIELDS
+            }
             
             self.is_running = True
             
             # Send status update
-            await self.telegram.send_bot_status_notification(self.get_status())
+            self.notify('bot_status', self.get_status())
             
             # Start monitoring
             await self.monitor_presale_conditions()
@@ -346,17 +489,18 @@ class ArbitrumPresaleBot:
             
         except Exception as e:
             self.logger.error(f"Error running bot: {e}")
-            await self.telegram.send_error_notification(str(e), "Main bot execution")
+            self.notify('error', str(e), "Main bot execution")
             return False
         finally:
             self.is_running = False
+            await self.telegram.aclose()
     
     def stop(self):
         """Stop the bot"""
         self.logger.info("Stopping bot...")
         self.is_running = False
         # Send shutdown notification
-        asyncio.create_task(self.telegram.send_shutdown_notification())
+        self.notify('shutdown')
     
     def get_status(self):
         """Get bot status"""
@@ -0,0 +1,30 @@
+import orjson
+from web3 import Web3
+from web3.datastructures import AttributeDict
+
+def _orjson_default(obj):
+    """Serialize the web3 types orjson doesn't know, like Web3JsonEncoder does"""
+    if isinstance(obj, AttributeDict):
+        return dict(obj)
+    if isinstance(obj, (bytes, bytearray)):
+        return Web3.to_hex(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class OrjsonHTTPProvider(Web3.HTTPProvider):
+    """HTTP provider that (de)serializes JSON-RPC payloads with orjson"""
+    
+    def encode_rpc_request(self, method, params):
+        rpc_dict = {
+            'jsonrpc': '2.0',
+            'method': method,
+            'params': params or [],
+            'id': next(self.request_counter)
+        }
+        try:
+            return orjson.dumps(rpc_dict, default=_orjson_default)
+        except TypeError:
+            # orjson only handles 64-bit integers, let web3's encoder deal with the rest
+            return super().encode_rpc_request(method, params)
+    
+    def decode_rpc_response(self, raw_response):
+        return orjson.loads(raw_response)
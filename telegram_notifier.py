@@ -1,123 +1,80 @@
 import asyncio
-import aiohttp
+import html
+import httpx
+import json
 import logging
+import orjson
+import ssl
+import time
 from datetime import datetime
+from typing import Optional
+from aiolimiter import AsyncLimiter
 from config import Config
+from units import GWEI
 
-class TelegramNotifier:
-    """Telegram notification system for the presale bot"""
-    
-    def __init__(self, config: Config):
-        self.config = config
-        self.bot_token = config.TELEGRAM_BOT_TOKEN
-        self.chat_id = config.TELEGRAM_CHAT_ID
-        self.base_url = f"https://api.telegram.org/bot{self.bot_token}"
-        self.logger = logging.getLogger(__name__)
-        
-        # Check if Telegram is configured
-        self.enabled = bool(self.bot_token and self.chat_id)
-        
-        if self.enabled:
-            self.logger.info("Telegram notifications enabled")
-        else:
-            self.logger.warning("Telegram notifications disabled - missing bot token or chat ID")
-    
-    async def send_message(self, message: str, parse_mode: str = "HTML"):
-        """Send a message to Telegram"""
-        if not self.enabled:
-            return False
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                payload = {
-                    'chat_id': self.chat_id,
-                    'text': message,
-                    'parse_mode': parse_mode
-                }
-                
-                async with session.post(f"{self.base_url}/sendMessage", json=payload) as response:
-                    if response.status == 200:
-                        return True
-                    else:
-                        error_text = await response.text()
-                        self.logger.error(f"Telegram API error: {response.status} - {error_text}")
-                        return False
-                        
-        except Exception as e:
-            self.logger.error(f"Error sending Telegram message: {e}")
-            return False
-    
-    async def send_presale_start_notification(self, presale_info: dict):
-        """Send notification when presale starts"""
-        message = f"""
+COALESCE_WINDOW = 0.25  # seconds
+MESSAGE_SEPARATOR = "\n━━━━━\n"
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+TELEGRAM_SEND_RATE = 0.9  # messages per second
+MAX_QUEUED_MESSAGES = 64
+DEDUPE_WINDOW = 60  # seconds an identical message is suppressed for
+DEDUPE_RETENTION = 300  # seconds before old entries are pruned
+
+# Notification templates, rendered with str.format
+_PRESALE_START_TEMPLATE = """
 🚀 <b>Presale Started!</b>
 
 📋 <b>Presale Details:</b>
-• Token: <code>{presale_info['token_address']}</code>
-• Start: {datetime.fromtimestamp(presale_info['presale_start'])}
-• End: {datetime.fromtimestamp(presale_info['presale_end'])}
-• Soft Cap: {presale_info['soft_cap']} ETH
-• Hard Cap: {presale_info['hard_cap']} ETH
+• Token: <code>{token}</code>
+• Start: {start}
+• End: {end}
+• Soft Cap: {soft_cap} ETH
+• Hard Cap: {hard_cap} ETH
 
 💰 <b>Bot Status:</b>
-• Wallet: <code>{self.config.WALLET_ADDRESS[:10]}...</code>
-• Investment: {self.config.TOKEN_AMOUNT} ETH
+• Wallet: <code>{wallet}...</code>
+• Investment: {investment} ETH
 • Monitoring: ✅ Active
-        """
-        await self.send_message(message)
-    
-    async def send_buy_attempt_notification(self, eth_amount: float, gas_price: int):
-        """Send notification when attempting to buy"""
-        gas_price_gwei = gas_price / 1e9
-        message = f"""
+"""
+
+_BUY_ATTEMPT_TEMPLATE = """
 🔄 <b>Buy Attempt</b>
 
 💰 <b>Transaction Details:</b>
-• Amount: {eth_amount} ETH
+• Amount: {amount} ETH
 • Gas Price: {gas_price_gwei:.2f} gwei
-• Contract: <code>{self.config.PRESALE_CONTRACT_ADDRESS[:10]}...</code>
+• Contract: <code>{contract}...</code>
 
-⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-        """
-        await self.send_message(message)
-    
-    async def send_buy_success_notification(self, tx_hash: str, eth_amount: float, tokens_received: int, gas_used: int):
-        """Send notification when buy is successful"""
-        message = f"""
+⏰ Time: {time}
+"""
+
+_BUY_SUCCESS_TEMPLATE = """
 ✅ <b>Buy Success!</b>
 
 💰 <b>Transaction Details:</b>
 • TX Hash: <code>{tx_hash}</code>
-• ETH Spent: {eth_amount} ETH
+• ETH Spent: {amount} ETH
 • Tokens Received: {tokens_received:,}
 • Gas Used: {gas_used:,}
 
-⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+⏰ Time: {time}
 
 🎉 <b>Presale participation successful!</b>
-        """
-        await self.send_message(message)
-    
-    async def send_buy_failure_notification(self, error: str):
-        """Send notification when buy fails"""
-        message = f"""
+"""
+
+_BUY_FAILURE_TEMPLATE = """
 ❌ <b>Buy Failed</b>
 
 🔍 <b>Error Details:</b>
 • Error: {error}
-• Contract: <code>{self.config.PRESALE_CONTRACT_ADDRESS[:10]}...</code>
+• Contract: <code>{contract}...</code>
 
-⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+⏰ Time: {time}
 
 ⚠️ Bot will retry automatically
-        """
-        await self.send_message(message)
-    
-    async def send_gas_warning_notification(self, current_gas: int, max_gas: int):
-        """Send notification when gas is too high"""
-        current_gwei = current_gas / 1e9
-        max_gwei = max_gas / 1e9
-        message = f"""
+"""
+
+_GAS_WARNING_TEMPLATE = """
 ⛽ <b>Gas Price Warning</b>
 
 💰 <b>Gas Details:</b>
@@ -125,93 +82,493 @@ class TelegramNotifier:
 • Max Allowed: {max_gwei:.2f} gwei
 • Status: ⏳ Waiting for better conditions
 
-⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-        """
-        await self.send_message(message)
-    
-    async def send_presale_ended_notification(self, total_raised: int, hard_cap: int):
-        """Send notification when presale ends"""
-        message = f"""
+⏰ Time: {time}
+"""
+
+_PRESALE_ENDED_TEMPLATE = """
 🏁 <b>Presale Ended</b>
 
 📊 <b>Final Stats:</b>
 • Total Raised: {total_raised} ETH
 • Hard Cap: {hard_cap} ETH
-• Success: {'✅' if total_raised >= hard_cap else '❌'}
+• Success: {success}
 
-⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-        """
-        await self.send_message(message)
-    
-    async def send_balance_warning_notification(self, current_balance: float, required_amount: float):
-        """Send notification when balance is low"""
-        message = f"""
+⏰ Time: {time}
+"""
+
+_BALANCE_WARNING_TEMPLATE = """
 ⚠️ <b>Low Balance Warning</b>
 
 💰 <b>Balance Details:</b>
-• Current: {current_balance:.4f} ETH
-• Required: {required_amount:.4f} ETH
-• Shortage: {required_amount - current_balance:.4f} ETH
+• Current: {current:.4f} ETH
+• Required: {required:.4f} ETH
+• Shortage: {shortage:.4f} ETH
 
-⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+⏰ Time: {time}
 
 💡 Please add more ETH to your wallet
-        """
-        await self.send_message(message)
-    
-    async def send_bot_status_notification(self, status: dict):
-        """Send bot status update"""
-        message = f"""
+"""
+
+_BOT_STATUS_TEMPLATE = """
 🤖 <b>Bot Status Update</b>
 
 📊 <b>Current Status:</b>
-• Running: {'✅' if status['is_running'] else '❌'}
-• Wallet: <code>{status['wallet_address'][:10]}...</code>
-• Presale: <code>{status['presale_address'][:10]}...</code>
-• Transactions: {status['transaction_count']}
+• Running: {running}
+• Wallet: <code>{wallet}...</code>
+• Presale: <code>{presale}...</code>
+• Transactions: {transaction_count}
 
-⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-        """
-        await self.send_message(message)
-    
-    async def send_error_notification(self, error: str, context: str = ""):
-        """Send error notification"""
-        message = f"""
+⏰ Time: {time}
+"""
+
+_ERROR_TEMPLATE = """
 🚨 <b>Bot Error</b>
 
 ❌ <b>Error:</b> {error}
-📝 <b>Context:</b> {context if context else "No additional context"}
+📝 <b>Context:</b> {context}
 
-⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+⏰ Time: {time}
 
 🔧 Bot will attempt to recover automatically
-        """
-        await self.send_message(message)
-    
-    async def send_startup_notification(self):
-        """Send notification when bot starts"""
-        message = f"""
+"""
+
+_STARTUP_TEMPLATE = """
 🚀 <b>Arbitrum Presale Bot Started</b>
 
 📋 <b>Configuration:</b>
 • Network: Arbitrum
-• Wallet: <code>{self.config.WALLET_ADDRESS[:10]}...</code>
-• Investment: {self.config.TOKEN_AMOUNT} ETH
-• Max Gas: {self.config.MAX_GAS_PRICE / 1e9:.2f} gwei
+• Wallet: <code>{wallet}...</code>
+• Investment: {investment} ETH
+• Max Gas: {max_gwei:.2f} gwei
 
-⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+⏰ Time: {time}
 
 ✅ Bot is now monitoring presale conditions
-        """
-        await self.send_message(message)
-    
-    async def send_shutdown_notification(self):
-        """Send notification when bot stops"""
-        message = f"""
+"""
+
+_SHUTDOWN_TEMPLATE = """
 🛑 <b>Arbitrum Presale Bot Stopped</b>
 
-⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+⏰ Time: {time}
 
 👋 Bot monitoring has been stopped
-        """
-        await self.send_message(message) 
\ No newline at end of file
+"""
+
+_now_second = None
+_now_text = ''
+
+def _now():
+    """Current time formatted for notifications, re-formatted once per second"""
+    global _now_second, _now_text
+    second = int(time.time())
+    if second != _now_second:
+        _now_second = second
+        _now_text = datetime.fromtimestamp(second).strftime('%Y-%m-%d %H:%M:%S')
+    return _now_text
+
+def _retry_after(error_text):
+    """Read the retry_after seconds from a Telegram 429 response body"""
+    try:
+        return json.loads(error_text)['parameters']['retry_after']
+    except (ValueError, KeyError, TypeError):
+        return 1
+
+def _safe_cut(text):
+    """Index to cut an over-long line at without splitting an HTML tag or entity"""
+    cut = TELEGRAM_MAX_MESSAGE_LENGTH
+    head = text[:cut]
+    for opener, closer in (('<', '>'), ('&', ';')):
+        start = head.rfind(opener)
+        if start > head.rfind(closer):
+            cut = min(cut, start)
+    return cut or TELEGRAM_MAX_MESSAGE_LENGTH
+
+def _split_message(message):
+    """Split a message over Telegram's length cap on line breaks"""
+    pieces = []
+    current = ''
+    for line in message.split('\n'):
+        candidate = f"{current}\n{line}" if current else line
+        if len(candidate) <= TELEGRAM_MAX_MESSAGE_LENGTH:
+            current = candidate
+            continue
+        
+        if current:
+            pieces.append(current)
+        while len(line) > TELEGRAM_MAX_MESSAGE_LENGTH:
+            cut = _safe_cut(line)
+            pieces.append(line[:cut])
+            line = line[cut:]
+        current = line
+    
+    if current:
+        pieces.append(current)
+    return pieces
+
+def _group_messages(messages):
+    """Group messages to join with MESSAGE_SEPARATOR within Telegram's length cap"""
+    groups = []
+    current = []
+    length = 0
+    for message in messages:
+        message = message.strip()
+        if len(message) > TELEGRAM_MAX_MESSAGE_LENGTH:
+            if current:
+                groups.append(current)
+                current, length = [], 0
+            groups.extend([piece] for piece in _split_message(message))
+            continue
+        
+        added = len(message) + (len(MESSAGE_SEPARATOR) if current else 0)
+        if length + added > TELEGRAM_MAX_MESSAGE_LENGTH:
+            groups.append(current)
+            current, length = [], 0
+            added = len(message)
+        current.append(message)
+        length += added
+    
+    if current:
+        groups.append(current)
+    return groups
+
+class TelegramNotifier:
+    """Telegram notification system for the presale bot"""
+    
+    def __init__(self, config: Config):
+        self.config = config
+        self.bot_token = config.TELEGRAM_BOT_TOKEN
+        self.chat_id = config.TELEGRAM_CHAT_ID
+        self.base_url = f"https://api.telegram.org/bot{self.bot_token}"
+        self._send_url = f"{self.base_url}/sendMessage"
+        self.logger = logging.getLogger(__name__)
+        
+        # Fixed message fields, computed once instead of per notification
+        self._truncated_wallet = (config.WALLET_ADDRESS or '')[:10]
+        self._truncated_presale = (config.PRESALE_CONTRACT_ADDRESS or '')[:10]
+        self._max_gwei = config.MAX_GAS_PRICE / GWEI
+        
+        # Built once, shared by every client the notifier creates
+        self._ssl_context = ssl.create_default_context()
+        
+        # Shared HTTP/2 client, multiplexes concurrent sends over one warm connection
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # Stay under Telegram's 1 msg/sec per chat limit (~0.9 msg/sec). aiolimiter
+        # can't acquire more than max_rate at once, so express it as 1 per 1/0.9 s
+        self._limiter = AsyncLimiter(max_rate=1, time_period=1 / TELEGRAM_SEND_RATE)
+        
+        # Urgent sends started by fire(), awaited by aclose()
+        self._pending: set[asyncio.Task] = set()
+        
+        # Hashes of recently queued messages -> time queued, see _is_duplicate
+        self._recent: dict[int, float] = {}
+        self._recent_pruned = time.monotonic()
+        
+        # Queued (text, parse_mode), coalesced by _flusher
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_QUEUED_MESSAGES)
+        self._flusher_task: Optional[asyncio.Task] = None
+        
+        # Check if Telegram is configured
+        self.enabled = bool(self.bot_token and self.chat_id)
+        
+        if self.enabled:
+            self.logger.info("Telegram notifications enabled")
+        else:
+            self.logger.warning("Telegram notifications disabled - missing bot token or chat ID")
+    
+    async def __aenter__(self):
+        self._start_flusher()
+        await self.warm_up()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                base_url=self.base_url,
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=75),
+                verify=self._ssl_context,
+                headers={'Content-Type': 'application/json'}
+            )
+        return self._client
+    
+    async def warm_up(self):
+        """Open the connection to Telegram with a cheap getMe call"""
+        if not self.enabled:
+            return
+        
+        # TCP + TLS setup happens here instead of on the first notification
+        try:
+            response = await self._get_client().get('getMe')
+            response.raise_for_status()
+        except Exception as e:
+            self.logger.warning("Telegram warm-up failed: %s", e)
+    
+    def fire(self, coro) -> asyncio.Task:
+        """Run an urgent send in the background so callers don't wait on Telegram"""
+        task = asyncio.create_task(coro)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        return task
+    
+    def _start_flusher(self):
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._flusher())
+    
+    async def _flusher(self):
+        """Send queued messages, joining those that arrive within COALESCE_WINDOW"""
+        while True:
+            batch = [await self._queue.get()]
+            await asyncio.sleep(COALESCE_WINDOW)
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            try:
+                for parse_mode in dict.fromkeys(mode for _, mode in batch):
+                    messages = [message for message, mode in batch if mode == parse_mode]
+                    for group in _group_messages(messages):
+                        status = await self._send(MESSAGE_SEPARATOR.join(group), parse_mode)
+                        if len(group) > 1 and status is not None and 400 <= status < 500 and status != 429:
+                            # One bad message rejects the whole batch, send them one by one
+                            for message in group:
+                                await self._do_send(message, parse_mode)
+            except Exception as e:
+                self.logger.error("Error flushing Telegram messages: %s", e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    async def flush(self, timeout: float = 10):
+        """Wait until queued messages have been sent"""
+        if self._flusher_task is None or self._flusher_task.done():
+            return
+        
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            self.logger.warning("Timed out flushing Telegram messages")
+    
+    async def aclose(self):
+        """Send pending and queued messages, then close the shared HTTP client"""
+        pending = self._pending - {asyncio.current_task()}
+        if pending:
+            try:
+                await asyncio.wait_for(asyncio.gather(*pending, return_exceptions=True), 10)
+            except asyncio.TimeoutError:
+                self.logger.warning("Timed out waiting for pending Telegram sends")
+        
+        await self.flush()
+        if self._flusher_task:
+            self._flusher_task.cancel()
+            self._flusher_task = None
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+    
+    def _is_duplicate(self, key) -> bool:
+        """Check whether the same message was queued within DEDUPE_WINDOW"""
+        return time.monotonic() - self._recent.get(hash(key), -DEDUPE_WINDOW) < DEDUPE_WINDOW
+    
+    def _remember(self, key):
+        """Record a queued message for _is_duplicate, pruning old entries"""
+        now = time.monotonic()
+        self._recent[hash(key)] = now
+        
+        if now - self._recent_pruned > DEDUPE_RETENTION:
+            self._recent = {k: sent for k, sent in self._recent.items() if now - sent < DEDUPE_RETENTION}
+            self._recent_pruned = now
+    
+    def _enqueue(self, item, dedupe_key=None) -> bool:
+        """Hand a message to the flusher, dropping it if the queue is full"""
+        self._start_flusher()
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.logger.warning("Telegram queue full, dropping message")
+            return False
+        
+        # Only queued messages count, a dropped one may be retried right away
+        if dedupe_key is not None:
+            self._remember(dedupe_key)
+        return True
+    
+    def send_message(self, message: str, parse_mode: str = "HTML", dedupe: bool = True):
+        """Queue a message for Telegram, bursts are sent as a single message"""
+        if not self.enabled:
+            return False
+        
+        dedupe_key = message if dedupe else None
+        if dedupe_key is not None and self._is_duplicate(dedupe_key):
+            return True
+        
+        return self._enqueue((message, parse_mode), dedupe_key)
+    
+    def send_template(self, template: str, parse_mode: str = "HTML", dedupe: bool = True, **fields):
+        """Render a message template, stamped with the current {time}, and queue it"""
+        if not self.enabled:
+            return False
+        
+        if parse_mode == "HTML":
+            # Values like error text can contain <, > or &
+            fields = {key: html.escape(value) if isinstance(value, str) else value
+                      for key, value in fields.items()}
+        
+        dedupe_key = (template, tuple(fields.items())) if dedupe else None
+        if dedupe_key is not None and self._is_duplicate(dedupe_key):
+            return True
+        
+        # Stamp the time now, the send can lag behind by the coalescing window,
+        # rate limiting and any 429 backoff
+        return self._enqueue((template.format(time=_now(), **fields), parse_mode), dedupe_key)
+    
+    async def send_message_urgent(self, message: str, parse_mode: str = "HTML"):
+        """Send a message to Telegram right away, bypassing the queue"""
+        if not self.enabled:
+            return False
+        
+        return await self._do_send(message, parse_mode)
+    
+    async def _do_send(self, message: str, parse_mode: str):
+        """Send a message to Telegram"""
+        return await self._send(message, parse_mode) == 200
+    
+    async def _send(self, message: str, parse_mode: str, retry_on_429: bool = True) -> Optional[int]:
+        """Send a message to Telegram, returning the HTTP status or None if the request failed"""
+        try:
+            client = self._get_client()
+            payload = {
+                'chat_id': self.chat_id,
+                'text': message,
+                'parse_mode': parse_mode
+            }
+            
+            async with self._limiter:
+                response = await client.post(self._send_url, content=orjson.dumps(payload))
+            
+            if response.status_code == 200:
+                return response.status_code
+            error_text = response.text
+            
+            if response.status_code == 429 and retry_on_429:
+                # Telegram says how long to back off, wait it out and retry once
+                retry_after = _retry_after(error_text)
+                self.logger.warning("Telegram rate limited, retrying in %ss", retry_after)
+                await asyncio.sleep(retry_after)
+                return await self._send(message, parse_mode, retry_on_429=False)
+            
+            self.logger.error("Telegram API error: %s - %s", response.status_code, error_text)
+            return response.status_code
+                    
+        except Exception as e:
+            self.logger.error("Error sending Telegram message: %s", e)
+            return None
+    
+    def send_presale_start_notification(self, presale_info: dict):
+        """Send notification when presale starts"""
+        return self.send_template(
+            _PRESALE_START_TEMPLATE,
+            token=presale_info['token_address'],
+            start=datetime.fromtimestamp(presale_info['presale_start']),
+            end=datetime.fromtimestamp(presale_info['presale_end']),
+            soft_cap=presale_info['soft_cap'],
+            hard_cap=presale_info['hard_cap'],
+            wallet=self._truncated_wallet,
+            investment=self.config.TOKEN_AMOUNT
+        )
+    
+    def send_buy_attempt_notification(self, eth_amount: float, gas_price: int):
+        """Send notification when attempting to buy"""
+        return self.send_template(
+            _BUY_ATTEMPT_TEMPLATE,
+            amount=eth_amount,
+            gas_price_gwei=gas_price / GWEI,
+            contract=self._truncated_presale
+        )
+    
+    def send_buy_success_notification(self, tx_hash: str, eth_amount: float, tokens_received: int, gas_used: int):
+        """Send notification when buy is successful"""
+        return self.send_template(
+            _BUY_SUCCESS_TEMPLATE,
+            dedupe=False,
+            tx_hash=tx_hash,
+            amount=eth_amount,
+            tokens_received=tokens_received,
+            gas_used=gas_used
+        )
+    
+    def send_buy_failure_notification(self, error: str):
+        """Send notification when buy fails"""
+        return self.send_template(
+            _BUY_FAILURE_TEMPLATE,
+            error=error,
+            contract=self._truncated_presale
+        )
+    
+    def send_gas_warning_notification(self, current_gas: int, max_gas: int):
+        """Send notification when gas is too high"""
+        return self.send_template(
+            _GAS_WARNING_TEMPLATE,
+            current_gwei=current_gas / GWEI,
+            max_gwei=max_gas / GWEI
+        )
+    
+    def send_presale_ended_notification(self, total_raised: int, hard_cap: int):
+        """Send notification when presale ends"""
+        return self.send_template(
+            _PRESALE_ENDED_TEMPLATE,
+            total_raised=total_raised,
+            hard_cap=hard_cap,
+            success='✅' if total_raised >= hard_cap else '❌'
+        )
+    
+    def send_balance_warning_notification(self, current_balance: float, required_amount: float):
+        """Send notification when balance is low"""
+        return self.send_template(
+            _BALANCE_WARNING_TEMPLATE,
+            current=current_balance,
+            required=required_amount,
+            shortage=required_amount - current_balance
+        )
+    
+    def send_bot_status_notification(self, status: dict):
+        """Send bot status update"""
+        return self.send_template(
+            _BOT_STATUS_TEMPLATE,
+            running='✅' if status['is_running'] else '❌',
+            wallet=self._truncated_wallet,
+            presale=self._truncated_presale,
+            transaction_count=status['transaction_count']
+        )
+    
+    def send_error_notification(self, error: str, context: str = ""):
+        """Send error notification"""
+        return self.send_template(
+            _ERROR_TEMPLATE,
+            error=error,
+            context=context if context else "No additional context"
+        )
+    
+    def send_startup_notification(self):
+        """Send notification when bot starts"""
+        message = _STARTUP_TEMPLATE.format(
+            wallet=self._truncated_wallet,
+            investment=self.config.TOKEN_AMOUNT,
+            max_gwei=self._max_gwei,
+            time=_now()
+        )
+        return self.fire(self.send_message_urgent(message))
+    
+    def send_shutdown_notification(self):
+        """Send notification when bot stops"""
+        message = _SHUTDOWN_TEMPLATE.format(time=_now())
+        return self.fire(self._send_shutdown(message))
+    
+    async def _send_shutdown(self, message: str):
+        # Let queued messages go out first so this one arrives last
+        await self.flush()
+        await self.send_message_urgent(message)
+        await self.aclose()
@@ -0,0 +1,3 @@
+# Plain int divisors for display values, avoids from_wei's Decimal round trip
+GWEI = 10**9
+ETHER = 10**18